@@ -33,7 +33,7 @@ class Request(BaseModel):  # pragma: no cover
     """
     method: Method = Method.GET
     url: AnyUrl
-    headers: Optional[Union[Json[dict], dict]]
+    headers: Optional[Union[dict, Json[dict]]]
     params: Optional[ReqParams]
     verify = True
     data: Optional[str] = None
@@ -46,10 +46,15 @@ class Client:
 
     def __init__(self, request: Request):  # pragma: no cover
         self.request = request
+        # only the query params change between calls, so the rest of the request is serialized once
+        self._call_kwargs = request.dict(exclude={'params'})
+        # reuse the connection across pages instead of a new TCP/TLS handshake per call
+        self.session = requests.Session()
 
-    def call(self, requests=requests) -> requests.Response:  # pragma: no cover
+    def call(self) -> requests.Response:  # pragma: no cover
         try:
-            response = requests.request(**self.request.dict())
+            params = self.request.params.dict() if self.request.params else None
+            response = self.session.request(**self._call_kwargs, params=params)
             response.raise_for_status()
             return response
         except Exception as exc:
@@ -84,12 +89,13 @@ class GetEvents:
         """
 
         events: list = self.make_api_call()  # type: ignore
-        if last_object_ids:
-            events = GetEvents.remove_duplicates(events, last_object_ids)
         while True:
+            if last_object_ids:
+                events = GetEvents.remove_duplicates(events, last_object_ids)
             yield events
-            last = events[-1]
-            self.client.set_next_run_filter(last['published'])
+            # the since filter is inclusive, so the next page starts with the events sharing the last timestamp
+            last_object_ids = GetEvents.get_last_run(events)['ids']
+            self.client.set_next_run_filter(events[-1]['published'])
             events: list = self.make_api_call()  # type: ignore
             try:
                 assert events
@@ -121,7 +127,7 @@ class GetEvents:
             if event.get('published') != last_time:
                 break
             ids.append(event.get('uuid'))
-        last_time = datetime.strptime(str(last_time).lower().replace('z', ''), '%Y-%m-%dt%H:%M:%S.%f')
+        last_time = datetime.fromisoformat(str(last_time).rstrip('Zz'))
         return {'after': last_time.isoformat(), 'ids': ids}
 
     @staticmethod
@@ -129,6 +135,7 @@ class GetEvents:
         """
         Remove object duplicates by the uuid of the object
         """
+        ids = set(ids)
         return [event for event in events if event['uuid'] not in ids]
 
 
@@ -172,7 +179,8 @@ def main():  # pragma: no cover
                 demisto.setLastRun(GetEvents.get_last_run(events))
                 should_push_events = True
             if should_push_events:
-                send_events_to_xsiam(events[:events_limit], demisto_params.get('vendor', 'okta'),
+                del events[events_limit:]
+                send_events_to_xsiam(events, demisto_params.get('vendor', 'okta'),
                                      demisto_params.get('product', 'okta'))
     except Exception as e:
         return_error(f'Failed to execute {demisto.command()} command. Error: {str(e)}')
@@ -45,11 +45,19 @@ def test_remove_duplicates(events, ids, result):
       {'published': '2022-04-17T12:32:36.667',
        'uuid': '1d0844b6-3148-11ec-9027-a5b57ec5fccc'}], {'after': '2022-04-17T12:32:36.667000',
                                                           'ids': ['1d0844b6-3148-11ec-9027-a5b57ec5fccc',
-                                                                  '1d0844b6-3148-11ec-9027-a5b57ec5fbbb']})])
+                                                                  '1d0844b6-3148-11ec-9027-a5b57ec5fbbb']}),
+    ([{'published': '2022-04-17T12:31:36.667Z',
+       'uuid': '1d0844b6-3148-11ec-9027-a5b57ec5faaa'}],
+     {'after': '2022-04-17T12:31:36.667000', 'ids': ['1d0844b6-3148-11ec-9027-a5b57ec5faaa']})])
 def test_get_last_run(events, result):
     assert get_events.get_last_run(events) == result
 
 
+@pytest.mark.parametrize("headers", [{'Accept': 'application/json'}, '{"Accept": "application/json"}'])
+def test_request_headers(headers):
+    assert Request(url='https://testurl.com', headers=headers).headers == {'Accept': 'application/json'}
+
+
 @pytest.mark.parametrize("time", ['2022-04-17T12:32:36.667)'])
 def test_set_since_value(time):
     req_params.set_since_value(time)
@@ -62,3 +70,12 @@ def test_make_api_call(mocker):
     assert get_events.make_api_call() == [{1}, {1}, {1}, {1}, {1}]
     mock_res.data = [{1}, {1}, {1}, {1}, {1}, {1}, {1}, {1}, {1}, {1}]
     assert get_events.make_api_call() == [{1}, {1}, {1}, {1}, {1}, {1}, {1}, {1}, {1}, {1}]
+
+
+def test_aggregated_results_page_boundary(mocker):
+    first_page = [{'published': '2022-04-17T12:31:36.667Z', 'uuid': 'a'},
+                  {'published': '2022-04-17T12:32:36.667Z', 'uuid': 'b'}]
+    second_page = [{'published': '2022-04-17T12:32:36.667Z', 'uuid': 'b'},
+                   {'published': '2022-04-17T12:33:36.667Z', 'uuid': 'c'}]
+    mocker.patch.object(get_events, 'make_api_call', side_effect=[first_page, second_page, []])
+    assert get_events.aggregated_results() == first_page + second_page[1:]
@@ -128,7 +128,7 @@ class Client(BaseClient):
             headers = self._headers
         full_url = full_url if full_url else urljoin(self._base_url, url_suffix)
 
-        res = requests.request(
+        res = self._session.request(
             method,
             full_url,
             verify=self._verify,
@@ -166,21 +166,23 @@ class Client(BaseClient):
             url_suffix=uri,
             params=query_param
         )
-        paged_results = response.json()
+        page = response.json()
         if response.status_code != 200:
             raise Exception(
-                f'Error occurred while calling Okta API: {response.request.url}. Response: {response.json()}')
-        while "next" in response.links and len(response.json()) > 0:
+                f'Error occurred while calling Okta API: {response.request.url}. Response: {page}')
+        paged_results = page
+        while "next" in response.links and len(page) > 0:
             next_page = response.links.get("next").get("url")
-            response = self._http_request(
+            response = self.http_request(
                 method="GET",
                 full_url=next_page,
                 url_suffix=''
             )
+            page = response.json()
             if response.status_code != 200:
                 raise Exception(
-                    f'Error occurred while calling Okta API: {response.request.url}. Response: {response.json()}')
-            paged_results += response.json()
+                    f'Error occurred while calling Okta API: {response.request.url}. Response: {page}')
+            paged_results.extend(page)
         return paged_results
 
     def get_app_user_assignment(self, application_id, user_id):
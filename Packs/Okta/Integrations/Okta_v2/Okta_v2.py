@@ -9,7 +9,7 @@ requests.packages.urllib3.disable_warnings()
 # CONSTANTS
 DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 SEARCH_LIMIT = 200
-PROFILE_ARGS = [
+PROFILE_ARGS = frozenset({
     'firstName',
     'lastName',
     'email',
@@ -41,11 +41,14 @@ PROFILE_ARGS = [
     'department',
     'managerId',
     'manager'
-]
+})
 GROUP_PROFILE_ARGS = [
     'name',
     'description'
 ]
+UNKNOWN_BROWSER = 'Unknown browser'
+UNKNOWN_OS = 'Unknown OS'
+UNKNOWN_DEVICE = 'Unknown device'
 
 
 class Client(BaseClient):
@@ -210,32 +213,35 @@ class Client(BaseClient):
         logs = []
         raw_logs = raw_logs if isinstance(raw_logs, list) else [raw_logs]
         for log in raw_logs:
-            if log.get('client', {}).get('userAgent'):
-                browser = log.get('client', {}).get('userAgent').get('browser')
+            client = log.get('client') or {}
+            user_agent = client.get('userAgent')
+            if user_agent:
+                browser = user_agent.get('browser')
                 if (not browser) or browser.lower() == 'unknown':
-                    browser = 'Unknown browser'
-                os = log.get('client', {}).get('userAgent').get('os')
+                    browser = UNKNOWN_BROWSER
+                os = user_agent.get('os')
                 if (not os) or os.lower() == 'unknown':
-                    os = 'Unknown OS'
-                device = log.get('client', {}).get('device')
+                    os = UNKNOWN_OS
+                device = client.get('device')
                 if (not device) or device.lower() == 'unknown':
-                    device = 'Unknown device'
-            targets = ''
-            if log.get('target'):
-                for target in log.get('target'):
-                    targets += f"{target.get('displayName')} ({target.get('type')})\n"
-            time_published = datetime.strptime(log.get('published'), '%Y-%m-%dT%H:%M:%S.%f%z').strftime("%m/%d/%Y, "
-                                                                                                        "%H:%M:%S")
+                    device = UNKNOWN_DEVICE
+            targets = ''.join(f"{target.get('displayName')} ({target.get('type')})\n"
+                              for target in log.get('target') or [])
+            # published is ISO-8601 (e.g. 2021-12-13T01:47:08.123Z), so slice it rather than parse it
+            published = log.get('published')
+            time_published = f'{published[5:7]}/{published[8:10]}/{published[0:4]}, {published[11:19]}'
+            actor = log.get('actor') or {}
+            outcome = log.get('outcome') or {}
             log = {
-                'Actor': f"{log.get('actor', {}).get('displayName')} ({log.get('actor', {}).get('type')})",
-                'ActorAlternaneId': log.get('actor', {}).get('alternateId'),
+                'Actor': f"{actor.get('displayName')} ({actor.get('type')})",
+                'ActorAlternaneId': actor.get('alternateId'),
                 'EventInfo': log.get('displayMessage'),
-                'EventOutcome': log.get('outcome', {}).get('result') + (
-                    f": {log.get('outcome', {}).get('reason')}" if log.get('outcome', {}).get('reason') else ''),
+                'EventOutcome': outcome.get('result') + (
+                    f": {outcome.get('reason')}" if outcome.get('reason') else ''),
                 'EventSeverity': log.get('severity'),
                 'Client': f"{browser} on {os} {device}",
-                'RequestIP': log.get('client', {}).get('ipAddress'),
-                'ChainIP': [ip_chain.get('ip') for ip_chain in log.get('request', {}).get('ipChain', [])],
+                'RequestIP': client.get('ipAddress'),
+                'ChainIP': [ip_chain.get('ip') for ip_chain in (log.get('request') or {}).get('ipChain', [])],
                 'Targets': targets or '-',
                 'Time': time_published
             }
@@ -433,12 +439,7 @@ class Client(BaseClient):
     # Build profile dict with pre-defined keys (for user)
     @staticmethod
     def build_profile(args):
-        profile = {}
-        keys = args.keys()
-        for key in PROFILE_ARGS:
-            if key in keys:
-                profile[key] = args[key]
-        return profile
+        return {key: value for key, value in args.items() if key in PROFILE_ARGS}
 
     # Build profile dict with pre-defined keys (for group)
     @staticmethod
@@ -487,8 +488,9 @@ class Client(BaseClient):
             resp_type='response',
             params=query_param
         )
-        paged_results = response.json()
-        while "next" in response.links and len(response.json()) > 0:
+        page = response.json()
+        paged_results = page
+        while "next" in response.links and len(page) > 0:
             next_page = response.links.get("next").get("url")
             response = self._http_request(
                 method="GET",
@@ -498,7 +500,8 @@ class Client(BaseClient):
                 params=query_param
 
             )
-            paged_results += response.json()
+            page = response.json()
+            paged_results.extend(page)
         return paged_results
 
     def get_group_members(self, group_id, limit):
@@ -517,11 +520,7 @@ class Client(BaseClient):
     def list_users(self, args):
         # Base url - if none of the above specified - returns all the users (default 200 items)
         uri = "users"
-        query_params = {}
-        for key, value in args.items():
-            if key == 'query':
-                key = 'q'
-            query_params[key] = encode_string_results(value)
+        query_params = {('q' if key == 'query' else key): value for key, value in args.items()}
         if args.get('limit'):
             return self._http_request(
                 method='GET',
@@ -533,11 +532,7 @@ class Client(BaseClient):
     def list_groups(self, args):
         # Base url - if none of the the above specified - returns all the groups (default 200 items)
         uri = "groups"
-        query_params = {}
-        for key, value in args.items():
-            if key == 'query':
-                key = 'q'
-            query_params[key] = encode_string_results(value)
+        query_params = {('q' if key == 'query' else key): value for key, value in args.items()}
         if args.get('limit'):
             return self._http_request(
                 method='GET',
@@ -548,11 +543,7 @@ class Client(BaseClient):
 
     def get_logs(self, args):
         uri = 'logs'
-        query_params = {}
-        for key, value in args.items():
-            if key == 'query':
-                key = 'q'
-            query_params[key] = encode_string_results(value)
+        query_params = {('q' if key == 'query' else key): value for key, value in args.items()}
         if args.get('limit'):
             return self._http_request(
                 method='GET',